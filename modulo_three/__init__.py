@@ -1,6 +1,11 @@
 """Streaming modulo computation via finite-state machine."""
 
-from modulo_three.builder import DeterministicMachineSpec, DeterministicTableMachineBuilder
+from modulo_three.builder import (
+    DeterministicMachineSpec,
+    DeterministicTableMachineBuilder,
+    FrozenDeterministicMachineSpec,
+    minimize_spec,
+)
 from modulo_three.machine import FiniteMachine
 from modulo_three.simple_facade import modThree
 
@@ -9,4 +14,6 @@ __all__ = [
     "FiniteMachine",
     "DeterministicMachineSpec",
     "DeterministicTableMachineBuilder",
+    "FrozenDeterministicMachineSpec",
+    "minimize_spec",
 ]
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-import argparse
 import sys
+from typing import TYPE_CHECKING
 
 from modulo_three import modThree
 
+if TYPE_CHECKING:
+    import argparse
+
 
 def _build_parser() -> argparse.ArgumentParser:
+    # Imported here so the common single-argument invocation never loads argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(prog="modulo_three")
     parser.add_argument("input_value", nargs="?", help="Binary input string (MSB first)")
     parser.add_argument(
@@ -38,15 +44,9 @@ def _interactive_mode() -> int:
         print(result)
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(argv)
-    if args.interactive:
-        return _interactive_mode()
-    if args.input_value is None:
-        parser.error("the following arguments are required: input_value")
+def _run_once(input_value: str) -> int:
     try:
-        result = modThree(args.input_value)
+        result = modThree(input_value)
     except (TypeError, ValueError) as exc:
         print(str(exc), file=sys.stderr)
         return 1
@@ -54,5 +54,20 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    arguments = sys.argv[1:] if argv is None else argv
+    # A lone positional argument needs no parsing; flags, help and usage errors
+    # still go through argparse.
+    if len(arguments) == 1 and not arguments[0].startswith("-"):
+        return _run_once(arguments[0])
+    parser = _build_parser()
+    args = parser.parse_args(arguments)
+    if args.interactive:
+        return _interactive_mode()
+    if args.input_value is None:
+        parser.error("the following arguments are required: input_value")
+    return _run_once(args.input_value)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
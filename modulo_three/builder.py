@@ -2,19 +2,30 @@
 
 This module defines:
 - a deterministic machine specification (`DeterministicMachineSpec`)
+- its hashable, immutable counterpart (`FrozenDeterministicMachineSpec`)
 - a deterministic builder interface (`DeterministicMachineBuilder`)
 - the standard table-based builder (`DeterministicTableMachineBuilder`)
+- DFA minimization (`minimize_spec`)
 - binary modulo helpers (`build_binary_mod_spec`, `build_binary_mod_machine`)
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Mapping
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 from modulo_three.machine import FiniteMachine
 
+_BINARY_SYMBOL_VALUES = {"0": 0, "1": 1}
+"""Binary alphabet with each symbol's digit value, so transitions never parse strings."""
+
+
+def _typed(value: object) -> tuple[object, type]:
+    return value, type(value)
+
 
 @dataclass(slots=True)
 class DeterministicMachineSpec[StateT: Hashable, SymbolT: Hashable]:
@@ -30,6 +41,69 @@ class DeterministicMachineSpec[StateT: Hashable, SymbolT: Hashable]:
     F: set[StateT]
     delta: Mapping[tuple[StateT, SymbolT], StateT]
 
+    def freeze(self) -> FrozenDeterministicMachineSpec[StateT, SymbolT]:
+        """Return an immutable, hashable snapshot of this specification."""
+        return FrozenDeterministicMachineSpec(
+            Q=frozenset(self.Q),
+            Sigma=frozenset(self.Sigma),
+            q0=self.q0,
+            F=frozenset(self.F),
+            delta=MappingProxyType(dict(self.delta)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDeterministicMachineSpec[StateT: Hashable, SymbolT: Hashable]:
+    """Immutable specification that can key caches of built machines.
+
+    Obtain one with :meth:`DeterministicMachineSpec.freeze`; equal frozen specs
+    build the same shared :class:`FiniteMachine` in
+    :class:`DeterministicTableMachineBuilder`. Equality also compares the type
+    of every element, so a spec over ``{False, True}`` never matches one over
+    ``{0, 1}``.
+    """
+
+    Q: frozenset[StateT]
+    Sigma: frozenset[SymbolT]
+    q0: StateT
+    F: frozenset[StateT]
+    delta: MappingProxyType[tuple[StateT, SymbolT], StateT]
+    _fingerprint: tuple[object, ...] = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        fingerprint = (
+            frozenset(map(_typed, self.Q)),
+            frozenset(map(_typed, self.Sigma)),
+            _typed(self.q0),
+            frozenset(map(_typed, self.F)),
+            frozenset(
+                (_typed(state), _typed(symbol), _typed(target))
+                for (state, symbol), target in self.delta.items()
+            ),
+        )
+        object.__setattr__(self, "_fingerprint", fingerprint)
+        object.__setattr__(self, "_hash", hash(fingerprint))
+
+    def __reduce__(self) -> tuple[Callable[..., object], tuple[object, ...]]:
+        """Pickle and copy with ``delta`` as a plain dict; its read-only view cannot be pickled."""
+        return _restore_frozen_spec, (self.Q, self.Sigma, self.q0, self.F, dict(self.delta))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+def _restore_frozen_spec[StateT: Hashable, SymbolT: Hashable](
+    Q: frozenset[StateT],
+    Sigma: frozenset[SymbolT],
+    q0: StateT,
+    F: frozenset[StateT],
+    delta: dict[tuple[StateT, SymbolT], StateT],
+) -> FrozenDeterministicMachineSpec[StateT, SymbolT]:
+    return FrozenDeterministicMachineSpec(
+        Q=Q, Sigma=Sigma, q0=q0, F=F, delta=MappingProxyType(delta)
+    )
+
 
 class DeterministicMachineBuilder[StateT: Hashable, SymbolT: Hashable](ABC):
     """Build a FiniteMachine from a deterministic specification."""
@@ -47,13 +121,17 @@ class DeterministicTableMachineBuilder[StateT: Hashable, SymbolT: Hashable](
     """Standard builder that materializes a finite machine from a deterministic spec.
 
     It supports arbitrary hashable state and symbol types with an explicit
-    transition table.
+    transition table. Frozen specs are memoized, so rebuilding an equal frozen
+    spec returns the machine built the first time.
     """
 
     def from_spec(
         self,
-        spec: DeterministicMachineSpec[StateT, SymbolT],
+        spec: DeterministicMachineSpec[StateT, SymbolT]
+        | FrozenDeterministicMachineSpec[StateT, SymbolT],
     ) -> FiniteMachine[StateT, SymbolT]:
+        if isinstance(spec, FrozenDeterministicMachineSpec):
+            return _build_from_frozen_spec(spec)
         return FiniteMachine(
             Q=set(spec.Q),
             Sigma=set(spec.Sigma),
@@ -63,29 +141,127 @@ class DeterministicTableMachineBuilder[StateT: Hashable, SymbolT: Hashable](
         )
 
 
+@lru_cache(maxsize=16)
+def _build_from_frozen_spec[StateT: Hashable, SymbolT: Hashable](
+    spec: FrozenDeterministicMachineSpec[StateT, SymbolT],
+) -> FiniteMachine[StateT, SymbolT]:
+    return FiniteMachine(
+        Q=spec.Q,
+        Sigma=spec.Sigma,
+        q0=spec.q0,
+        F=spec.F,
+        delta=spec.delta,
+    )
+
+
+def minimize_spec[StateT: Hashable, SymbolT: Hashable](
+    spec: DeterministicMachineSpec[StateT, SymbolT],
+) -> DeterministicMachineSpec[StateT, SymbolT]:
+    """Return the minimal spec accepting the same language as ``spec``.
+
+    States unreachable from q0 are dropped and equivalent states are merged
+    with Hopcroft's partition refinement in O(|Q|·|Σ|·log |Q|). Each merged
+    class is represented by its member reached first from q0, so q0 is kept.
+
+    Only acceptance is preserved: a machine whose final state carries meaning
+    beyond membership in F, such as a binary-mod remainder machine with every
+    state accepting, collapses accordingly. ``spec`` must be total.
+    """
+    symbols = list(spec.Sigma)
+    delta = spec.delta
+
+    order = [spec.q0]
+    reached = {spec.q0}
+    for state in order:
+        for symbol in symbols:
+            next_state = delta[(state, symbol)]
+            if next_state not in reached:
+                reached.add(next_state)
+                order.append(next_state)
+    index = {state: position for position, state in enumerate(order)}
+    predecessors: list[list[list[int]]] = [[[] for _ in order] for _ in symbols]
+    for position, state in enumerate(order):
+        for column, symbol in enumerate(symbols):
+            predecessors[column][index[delta[(state, symbol)]]].append(position)
+
+    accepting = {position for position, state in enumerate(order) if state in spec.F}
+    blocks = [block for block in (accepting, set(range(len(order))) - accepting) if block]
+    block_of = [0] * len(order)
+    for block_id, block in enumerate(blocks):
+        for position in block:
+            block_of[position] = block_id
+    pending = {min(range(len(blocks)), key=lambda block_id: len(blocks[block_id]))}
+    while pending:
+        splitter = tuple(blocks[pending.pop()])
+        for column_predecessors in predecessors:
+            touched: dict[int, set[int]] = {}
+            for target in splitter:
+                for position in column_predecessors[target]:
+                    touched.setdefault(block_of[position], set()).add(position)
+            for block_id, inside in touched.items():
+                block = blocks[block_id]
+                if len(inside) == len(block):
+                    continue
+                block -= inside
+                new_id = len(blocks)
+                blocks.append(inside)
+                for position in inside:
+                    block_of[position] = new_id
+                if block_id in pending or len(inside) <= len(block):
+                    pending.add(new_id)
+                else:
+                    pending.add(block_id)
+
+    representatives = [order[min(block)] for block in blocks]
+    states = set(representatives)
+    return DeterministicMachineSpec(
+        Q=states,
+        Sigma=set(spec.Sigma),
+        q0=spec.q0,
+        F={state for state in states if state in spec.F},
+        delta={
+            (state, symbol): representatives[block_of[index[delta[(state, symbol)]]]]
+            for state in states
+            for symbol in symbols
+        },
+    )
+
+
 def build_binary_mod_spec(mod: int) -> DeterministicMachineSpec[int, str]:
     _validate_mod(mod)
 
     states = set(range(mod))
-    alphabet = {"0", "1"}
+    # A tuple is cheaper to re-iterate per state than a fresh dict items view.
+    symbol_values = tuple(_BINARY_SYMBOL_VALUES.items())
     transitions: dict[tuple[int, str], int] = {
-        (state, symbol): (2 * state + int(symbol)) % mod
+        (state, symbol): (2 * state + bit) % mod
         for state in states
-        for symbol in alphabet
+        for symbol, bit in symbol_values
     }
 
     return DeterministicMachineSpec(
         Q=states,
-        Sigma=alphabet,
+        Sigma=set(_BINARY_SYMBOL_VALUES),
         q0=0,
         F=set(states),
         delta=transitions,
     )
 
 
+@lru_cache(maxsize=32, typed=True)
 def build_binary_mod_machine(mod: int) -> FiniteMachine[int, str]:
     spec = build_binary_mod_spec(mod)
-    return DeterministicTableMachineBuilder[int, str]().from_spec(spec)
+    # The spec is built locally and total by construction, so skip re-validation.
+    # Machines are immutable in practice, so one instance per modulus is shared.
+    # Every state accepts, so Q and F share one frozenset of the mod state ints.
+    states = frozenset(spec.Q)
+    return FiniteMachine[int, str]._trusted(  # pyright: ignore[reportPrivateUsage]
+        Q=states,
+        Sigma=frozenset(spec.Sigma),
+        q0=spec.q0,
+        F=states,
+        delta=spec.delta,
+    )
 
 
 def _validate_mod(mod: object) -> None:
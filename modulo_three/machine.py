@@ -43,8 +43,30 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import Hashable, Iterable, Mapping
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import MISSING, dataclass, field, fields
+from itertools import islice
+from types import MappingProxyType
+from typing import Literal, cast
+
+type ByteInput = bytes | bytearray | memoryview
+"""Binary buffers that :meth:`FiniteMachine.run` can read as ASCII-encoded symbols."""
+
+_MISSING_PAIRS_SHOWN = 10
+"""How many missing (state, symbol) pairs a totality error lists."""
+_WORD_FORMATS: dict[int, Literal["Q", "I", "H"]] = {8: "Q", 4: "I", 2: "H"}
+"""``memoryview`` format of each word size :meth:`FiniteMachine.run_bytes` can read,
+largest first. Sizes are powers of two: the composed table is built by repeated squaring."""
+_WORD_TABLE_BUDGET = 1 << 14
+"""Upper bound on ``len(Q) * len(Sigma) ** word_size`` entries in the composed word table."""
+_NO_SYMBOL = 0xFF
+"""Entry of :attr:`FiniteMachine._symbol_ids` for bytes that encode no symbol."""
+_STREAM_CHUNK_SIZE = 1 << 12
+"""Symbols buffered at a time when :meth:`FiniteMachine.run` reads a one-shot iterable."""
+_WORD_RUN_MIN_LENGTH = 64
+"""Shortest string :meth:`FiniteMachine.run` encodes for :meth:`FiniteMachine.run_bytes`."""
 
 
 @dataclass(slots=True)
@@ -66,31 +88,112 @@ class FiniteMachine[StateT: Hashable, SymbolT: Hashable]:
             against the alphabet and for use as dictionary keys.
     """
 
-    Q: set[StateT]
-    """Set of all possible states in the machine. Must contain q0 and all F states."""
-    Sigma: set[SymbolT]
+    Q: AbstractSet[StateT]
+    """Set of all possible states in the machine. Must contain q0 and all F states.
+    Stored as a frozenset so that machines can be cached and shared."""
+    Sigma: AbstractSet[SymbolT]
     """Set of valid input symbols (the alphabet). All input symbols processed by
-    the machine must be members of this set."""
+    the machine must be members of this set. Stored as a frozenset."""
     q0: StateT
     """The initial/starting state. Must be a member of Q."""
-    F: set[StateT]
+    F: AbstractSet[StateT]
     """Set of accepting/final states. A subset of Q. The machine 'accepts' input
-    if it ends in a state that is a member of this set."""
+    if it ends in a state that is a member of this set. Stored as a frozenset."""
     delta: Mapping[tuple[StateT, SymbolT], StateT]
     """Transition function mapping (state, symbol) pairs to next states.
     This is the core of the DFA: for each state and valid input symbol,
-    exactly one next state is defined. Keys are (state, symbol) tuples."""
+    exactly one next state is defined. Keys are (state, symbol) tuples.
+    Stored as a read-only view so it cannot drift from the compiled tables."""
+    _delta_table: list[int] = field(
+        default_factory=list[int], init=False, repr=False, compare=False
+    )
+    """Flat transition table indexed by ``state_index * len(Sigma) + symbol_index``,
+    holding state indices into :attr:`_states`."""
+    _states: Sequence[StateT] = field(default=(), init=False, repr=False, compare=False)
+    """State at each row of :attr:`_delta_table`. Dense integer states use
+    ``range(len(Q))``, so each state is its own index."""
+    _initial_index: int = field(default=0, init=False, repr=False, compare=False)
+    """Row of q0 in :attr:`_delta_table`."""
+    _symbol_index: dict[SymbolT, int] = field(
+        default_factory=dict[SymbolT, int], init=False, repr=False, compare=False
+    )
+    """Column index of each symbol in :attr:`_delta_table`."""
+    _word_table: list[dict[int, int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Composed transitions for :meth:`run_bytes`, built on first use. Entry
+    ``[state][word]`` is the state reached after consuming the
+    :attr:`_word_size` ASCII symbols packed in the native integer ``word``."""
+    _word_size: int = field(default=0, init=False, repr=False, compare=False)
+    """Bytes per word of :attr:`_word_table`; the largest size within budget."""
+    _rows: dict[StateT, dict[SymbolT, StateT]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """``delta`` regrouped as ``[state][symbol]`` for :meth:`step`, built on first
+    use. Two small dict probes beat building and hashing a ``(state, symbol)``
+    tuple."""
+    _symbol_deletions: dict[int, int | None] = field(
+        default_factory=dict[int, int | None], init=False, repr=False, compare=False
+    )
+    """``str.translate`` table deleting every one-character string symbol of Σ.
+    Iterating a string only yields one-character strings, so whatever survives
+    the translation is invalid input, found in a single C-level pass."""
+    _ascii_symbols: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether every symbol is a one-character ASCII string, so that byte input
+    can be read as encoded text by :meth:`run_bytes`."""
+    _symbol_ids: bytes = field(default=b"", init=False, repr=False, compare=False)
+    """``bytes.translate`` table mapping each byte to its symbol's column in
+    :attr:`_delta_table`, or to ``_NO_SYMBOL``. Only built for ASCII symbols."""
 
     def __post_init__(self) -> None:
-        # Defensive copies to avoid aliasing surprises.
-        self.Q = set(self.Q)
-        self.Sigma = set(self.Sigma)
-        self.F = set(self.F)
-        self.delta = dict(self.delta)
+        # Defensive copies to avoid aliasing surprises; frozen so they can be shared.
+        self.Q = frozenset(self.Q)
+        self.Sigma = frozenset(self.Sigma)
+        self.F = frozenset(self.F)
+        self.delta = MappingProxyType(dict(self.delta))
 
         self._validate_definition_total()
+        self._compile_symbol_deletions()
+        self._compile_delta_table()
+
+    def __reduce__(self) -> tuple[Callable[..., object], tuple[object, ...]]:
+        """Pickle and copy through the constructor; ``delta``'s read-only view cannot be pickled."""
+        return type(self), (self.Q, self.Sigma, self.q0, self.F, dict(self.delta))
+
+    @classmethod
+    def _trusted(
+        cls,
+        Q: frozenset[StateT],
+        Sigma: frozenset[SymbolT],
+        q0: StateT,
+        F: frozenset[StateT],
+        delta: Mapping[tuple[StateT, SymbolT], StateT],
+    ) -> FiniteMachine[StateT, SymbolT]:
+        """Adopt a definition that its builder already guarantees to be a valid total DFA.
+
+        Skips the defensive copies and the O(|Q|·|Σ|) validation of
+        ``__post_init__``; the collections are adopted without copying, so the caller must
+        hand over a freshly built ``delta`` and not mutate it afterwards.
+        """
+        machine = object.__new__(cls)
+        machine.Q = Q
+        machine.Sigma = Sigma
+        machine.q0 = q0
+        machine.F = F
+        machine.delta = MappingProxyType(delta)
+        # Derived fields take the dataclass defaults, so this cannot drift from them.
+        for private_field in fields(cls):
+            if private_field.init:
+                continue
+            if private_field.default_factory is not MISSING:
+                setattr(machine, private_field.name, private_field.default_factory())
+            else:
+                setattr(machine, private_field.name, private_field.default)
+        machine._compile_symbol_deletions()
+        machine._compile_delta_table()
+        return machine
 
-    def run(self, input_symbols: Iterable[SymbolT]) -> StateT:
+    def run(self, input_symbols: Iterable[SymbolT] | ByteInput) -> StateT:
         """Process input left-to-right and return the final state.
 
         Starting from the initial state q0, this method sequentially applies
@@ -98,7 +201,10 @@ class FiniteMachine[StateT: Hashable, SymbolT: Hashable]:
         uses (current_state, symbol) as the key in the delta mapping.
 
         Args:
-            input_symbols: An iterable of symbols from the alphabet Σ.
+            input_symbols: An iterable of symbols from the alphabet Σ. When every
+                symbol is a one-character ASCII string, ``bytes``, ``bytearray``
+                and ``memoryview`` input is read as encoded text through
+                :meth:`run_bytes`; otherwise it is iterated as integers.
 
         Returns:
             The final state after processing all input symbols.
@@ -109,12 +215,50 @@ class FiniteMachine[StateT: Hashable, SymbolT: Hashable]:
         Note:
             This implements a deterministic finite automaton (DFA). The
             transition function is total, so every (state, symbol) pair is
-            defined in delta.
+            defined in delta. Steps read the flat :attr:`_delta_table`
+            instead of hashing (state, symbol) keys.
+            String input is validated up front in a single pass, and other
+            sequences are only rescanned for the error index when a lookup
+            fails, so neither carries a per-symbol membership test.
         """
-        current_state = self.q0
-        for index, symbol in enumerate(input_symbols):
-            current_state = self.step(current_state, symbol, index=index)
-        return current_state
+        # Strings are the common case, so they are dispatched first.
+        if isinstance(input_symbols, str):
+            return self._run_str(input_symbols)
+        if isinstance(input_symbols, bytes | bytearray | memoryview):
+            if self._ascii_symbols:
+                return self.run_bytes(cast(ByteInput, input_symbols))
+            return self._run_iterable(cast(Iterable[SymbolT], input_symbols))
+        return self._run_iterable(input_symbols)
+
+    def _run_str(self, text: str) -> StateT:
+        """Run a string with its validation and table loop inlined."""
+        if (
+            len(text) >= _WORD_RUN_MIN_LENGTH
+            and text.isascii()
+            and (self._word_table is not None or self._compile_word_table() is not None)
+        ):
+            # Long text reads a word of symbols per lookup and validates as it goes.
+            return self.run_bytes(text.encode("ascii"))
+        if self._symbol_ids and text.isascii():
+            return self._states[self._run_symbol_ids(text.encode("ascii"), self._initial_index)]
+        self._require_valid_str(text)
+        table = self._delta_table
+        symbol_index = cast("dict[str, int]", self._symbol_index)
+        width = len(symbol_index)
+        current_index = self._initial_index
+        for symbol in text:
+            current_index = table[current_index * width + symbol_index[symbol]]
+        return self._states[current_index]
+
+    def _run_iterable(self, input_symbols: Iterable[SymbolT]) -> StateT:
+        if isinstance(input_symbols, Sequence):
+            try:
+                return self._run_valid(input_symbols)
+            except KeyError:
+                self._raise_first_invalid(input_symbols)
+                raise
+        # One-shot iterables cannot be rescanned, so track the index as we go.
+        return self._run_stream(input_symbols)
 
     def step(
         self,
@@ -124,13 +268,121 @@ class FiniteMachine[StateT: Hashable, SymbolT: Hashable]:
         index: int | None = None,
     ) -> StateT:
         """Advance the machine by one symbol and return the next state."""
-        if symbol not in self.Sigma:
-            if index is None:
-                raise ValueError(f"invalid symbol: {symbol!r}")
+        rows = self._rows
+        if rows is None:
+            rows = self._compile_rows()
+        try:
+            return rows[state][symbol]
+        except KeyError:
+            if symbol not in self.Sigma:
+                if index is None:
+                    raise ValueError(f"invalid symbol: {symbol!r}") from None
+                raise ValueError(f"invalid symbol at index {index}: {symbol!r}") from None
+            raise
+
+    def _run_valid(self, input_symbols: Iterable[SymbolT]) -> StateT:
+        """Run input without membership tests; a symbol outside Σ raises KeyError."""
+        table = self._delta_table
+        symbol_index = self._symbol_index
+        width = len(symbol_index)
+        current_index = self._initial_index
+        for symbol in input_symbols:
+            current_index = table[current_index * width + symbol_index[symbol]]
+        return self._states[current_index]
+
+    def _require_valid_str(self, input_symbols: str) -> None:
+        invalid = input_symbols.translate(self._symbol_deletions)
+        if invalid:
+            symbol = invalid[0]
+            index = input_symbols.index(symbol)
             raise ValueError(f"invalid symbol at index {index}: {symbol!r}")
-        return self.delta[(state, symbol)]
 
-    def accepts(self, input_symbols: Iterable[SymbolT]) -> bool:
+    def _raise_first_invalid(self, input_symbols: Sequence[SymbolT], offset: int = 0) -> None:
+        sigma = self.Sigma
+        for index, symbol in enumerate(input_symbols, offset):
+            if symbol not in sigma:
+                raise ValueError(f"invalid symbol at index {index}: {symbol!r}")
+
+    def _run_stream(self, input_symbols: Iterable[SymbolT]) -> StateT:
+        """Run a one-shot iterable in bounded chunks.
+
+        Each chunk is a list, so like other sequences it runs without an index
+        or membership test and is only rescanned when a lookup fails, while
+        memory stays bounded by ``_STREAM_CHUNK_SIZE`` symbols.
+        """
+        iterator = iter(input_symbols)
+        table = self._delta_table
+        symbol_index = self._symbol_index
+        width = len(symbol_index)
+        current_index = self._initial_index
+        offset = 0
+        while chunk := list(islice(iterator, _STREAM_CHUNK_SIZE)):
+            try:
+                for symbol in chunk:
+                    current_index = table[current_index * width + symbol_index[symbol]]
+            except KeyError:
+                self._raise_first_invalid(chunk, offset)
+                raise
+            offset += len(chunk)
+        return self._states[current_index]
+
+    def run_bytes(self, buf: ByteInput) -> StateT:
+        """Process ASCII-encoded single-character symbols and return the final state.
+
+        This is equivalent to ``run(buf.decode("ascii"))`` for machines whose
+        alphabet consists of one-character ASCII strings. When the composed word
+        table fits within budget, the buffer is read as native 8-, 4- or 2-byte
+        words and each word advances the machine by that many symbols in a
+        single lookup.
+
+        Raises:
+            ValueError: If any byte does not encode a symbol of the alphabet Σ.
+        """
+        view = memoryview(buf)
+        if not view.c_contiguous:
+            # Strided views cannot be cast or decoded in place, so copy them once.
+            view = memoryview(bytes(view))
+        if not self._symbol_ids:
+            return self._run_str(str(view, "latin-1"))
+        word_table = self._word_table
+        if word_table is None:
+            word_table = self._compile_word_table()
+        if word_table is None:
+            return self._states[self._run_symbol_ids(bytes(view), self._initial_index)]
+
+        word_size = self._word_size
+        view = view.cast("B")
+        end = len(view) // word_size * word_size
+        current_state = self._initial_index
+        try:
+            for word in view[:end].cast(_WORD_FORMATS[word_size]):
+                current_state = word_table[current_state][word]
+        except KeyError:
+            # Rescan the bytes to report the position of the invalid symbol.
+            self._run_symbol_ids(bytes(view[:end]), self._initial_index)
+            raise
+        return self._states[self._run_symbol_ids(bytes(view[end:]), current_state, end)]
+
+    def _run_symbol_ids(self, encoded: bytes, current_index: int, offset: int = 0) -> int:
+        """Run ASCII-encoded symbols from row ``current_index`` and return the final row.
+
+        One ``bytes.translate`` pass maps every byte to its symbol column, so the
+        loop does no hashing and invalid bytes are found with a single ``find``.
+        ``offset`` is the position of ``encoded`` within the whole input, for
+        error messages.
+        """
+        symbol_ids = encoded.translate(self._symbol_ids)
+        invalid = symbol_ids.find(_NO_SYMBOL)
+        if invalid >= 0:
+            symbol = chr(encoded[invalid])
+            raise ValueError(f"invalid symbol at index {offset + invalid}: {symbol!r}")
+        table = self._delta_table
+        width = len(self._symbol_index)
+        for symbol_id in symbol_ids:
+            current_index = table[current_index * width + symbol_id]
+        return current_index
+
+    def accepts(self, input_symbols: Iterable[SymbolT] | ByteInput) -> bool:
         """Return True if the input is accepted by the machine.
 
         A DFA accepts input when the final state after processing the input
@@ -153,42 +405,165 @@ class FiniteMachine[StateT: Hashable, SymbolT: Hashable]:
         These constraints ensure the machine is well-formed and can process
         any valid input without encountering undefined states or symbols.
         """
+        self._validate_shapes()
+        self._validate_delta_total()
+
+    def _validate_shapes(self) -> None:
+        """Check constraints 1-3, which never look at the transition table."""
         if not self.Q:
             raise ValueError("Q must be non-empty")
         if not self.Sigma:
             raise ValueError("Sigma must be non-empty")
         if self.q0 not in self.Q:
             raise ValueError(f"q0 must be a member of Q: q0={self.q0!r}")
-        if not self.F.issubset(self.Q):
-            extra = self.F.difference(self.Q)
+        if not self.F <= self.Q:
+            extra = self.F - self.Q
             raise ValueError(f"F must be a subset of Q: extra={extra!r}")
 
-        for key, next_state in self.delta.items():
-            state, symbol = key
-            if state not in self.Q:
+    def _validate_delta_total(self) -> None:
+        """Check constraints 4-7 with a single pass over ``delta``.
+
+        Totality follows from the key checks plus a cardinality comparison; the
+        missing pairs are only enumerated, lazily and at most eleven of them,
+        when the error message is built.
+        """
+        states = self.Q
+        symbols = self.Sigma
+        delta = self.delta
+        for (state, symbol), next_state in delta.items():
+            if state not in states:
                 raise ValueError(
                     f"delta key state must be in Q: state={state!r}, symbol={symbol!r}"
                 )
-            if symbol not in self.Sigma:
+            if symbol not in symbols:
                 raise ValueError(
                     f"delta key symbol must be in Sigma: state={state!r}, symbol={symbol!r}"
                 )
-            if next_state not in self.Q:
+            if next_state not in states:
                 raise ValueError(
                     f"delta value must be in Q: key={(state, symbol)!r}, next_state={next_state!r}"
                 )
 
-        expected_count = len(self.Q) * len(self.Sigma)
-        if len(self.delta) != expected_count:
-            missing = [
+        expected_count = len(states) * len(symbols)
+        if len(delta) != expected_count:
+            missing_pairs = (
                 (state, symbol)
-                for state in self.Q
-                for symbol in self.Sigma
-                if (state, symbol) not in self.delta
-            ]
-            suffix = " (truncated)" if len(missing) > 10 else ""
-            details = f"missing={missing[:10]!r}{suffix}"
+                for state in states
+                for symbol in symbols
+                if (state, symbol) not in delta
+            )
+            missing = list(islice(missing_pairs, _MISSING_PAIRS_SHOWN + 1))
+            suffix = " (truncated)" if len(missing) > _MISSING_PAIRS_SHOWN else ""
+            details = f"missing={missing[:_MISSING_PAIRS_SHOWN]!r}{suffix}"
             raise ValueError(
                 "delta must be total over QxSigma: "
-                f"expected={expected_count}, actual={len(self.delta)}; {details}"
+                f"expected={expected_count}, actual={len(delta)}; {details}"
+            )
+
+    def _compile_symbol_deletions(self) -> None:
+        characters = [
+            symbol for symbol in self.Sigma if isinstance(symbol, str) and len(symbol) == 1
+        ]
+        self._symbol_deletions = str.maketrans("", "", "".join(characters))
+        self._ascii_symbols = len(characters) == len(self.Sigma) and all(
+            character.isascii() for character in characters
+        )
+
+    def _compile_delta_table(self) -> None:
+        """Build the flat transition table used by :meth:`run`.
+
+        States are numbered ``0..len(Q)-1`` and each transition is stored at
+        offset ``state_index * len(Sigma) + symbol_index`` of a contiguous table,
+        so a step costs one indexed read instead of a tuple allocation and a
+        dict probe; only the final index is mapped back to a state. When the
+        states already are those integers (as produced by the binary modulo
+        builder), they serve as their own indices. The table is a ``list``:
+        indexing it returns the stored int object directly, whereas ``bytes``
+        and ``array`` indexing must convert each element, which measured about
+        a third slower in the run loops.
+        """
+        states = self.Q
+        size = len(states)
+        symbol_index = {symbol: index for index, symbol in enumerate(self.Sigma)}
+        delta = self.delta
+        # Distinct integers spanning 0..size-1 are exactly range(size); checking the
+        # bounds avoids materializing that range as a set for comparison.
+        int_states = cast(AbstractSet[int], states)
+        if all(type(state) is int for state in states) and (
+            min(int_states) == 0 and max(int_states) == size - 1
+        ):
+            self._states = cast(Sequence[StateT], range(size))
+            self._initial_index = cast(int, self.q0)
+            transitions = cast(
+                list[int],
+                [delta[(state, symbol)] for state in self._states for symbol in symbol_index],
             )
+        else:
+            self._states = tuple(states)
+            state_index = {state: index for index, state in enumerate(self._states)}
+            self._initial_index = state_index[self.q0]
+            transitions = [
+                state_index[delta[(state, symbol)]]
+                for state in self._states
+                for symbol in symbol_index
+            ]
+        self._delta_table = transitions
+        self._symbol_index = symbol_index
+        if self._ascii_symbols:
+            symbol_ids = bytearray([_NO_SYMBOL]) * 0x100
+            for symbol, symbol_id in symbol_index.items():
+                symbol_ids[ord(cast(str, symbol))] = symbol_id
+            self._symbol_ids = bytes(symbol_ids)
+
+    def _compile_rows(self) -> dict[StateT, dict[SymbolT, StateT]]:
+        rows: dict[StateT, dict[SymbolT, StateT]] = {state: {} for state in self.Q}
+        for (state, symbol), next_state in self.delta.items():
+            rows[state][symbol] = next_state
+        self._rows = rows
+        return rows
+
+    def _compile_word_table(self) -> list[dict[int, int]] | None:
+        """Compose a word of transitions per entry for :meth:`run_bytes`.
+
+        The table is only built for machines whose symbols are one-character
+        ASCII strings, using the largest word size whose composed table stays
+        within ``_WORD_TABLE_BUDGET``; otherwise ``None`` is returned.
+        """
+        table = self._delta_table
+        symbol_index = self._symbol_index
+        width = len(symbol_index)
+        if not self._ascii_symbols:
+            return None
+        word_size = next(
+            (size for size in _WORD_FORMATS if len(self.Q) * width**size <= _WORD_TABLE_BUDGET),
+            None,
+        )
+        if word_size is None:
+            return None
+
+        # Start from single-symbol rows keyed by byte value and square the step
+        # (1 -> 2 -> 4 -> 8 symbols). Each squaring composes a row with the rows
+        # of its intermediate states; keys are joined as native-order integers
+        # so they match the words produced by ``memoryview.cast``.
+        rows = [
+            {
+                ord(cast(str, symbol)): table[state * width + symbol_id]
+                for symbol, symbol_id in symbol_index.items()
+            }
+            for state in range(len(self.Q))
+        ]
+        little_endian = sys.byteorder == "little"
+        shift = 8
+        while shift < 8 * word_size:
+            rows = [
+                {
+                    (prefix | suffix << shift if little_endian else prefix << shift | suffix): end
+                    for prefix, middle in row.items()
+                    for suffix, end in rows[middle].items()
+                }
+                for row in rows
+            ]
+            shift *= 2
+        self._word_size = word_size
+        self._word_table = rows
+        return self._word_table
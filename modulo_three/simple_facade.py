@@ -7,6 +7,9 @@ from functools import lru_cache
 from modulo_three.builder import build_binary_mod_machine
 from modulo_three.machine import FiniteMachine
 
+_SHORT_INPUT_MAX_LENGTH = 7
+"""Longest input answered from the table precomputed by the machine."""
+
 
 def _require_str(input_value: object) -> str:
     if not isinstance(input_value, str):
@@ -21,7 +24,34 @@ def _get_mod_three_machine() -> FiniteMachine[int, str]:
     return build_binary_mod_machine(3)
 
 
+@lru_cache(maxsize=1)
+def _get_short_input_remainders() -> dict[str, int]:
+    """Map every binary string up to ``_SHORT_INPUT_MAX_LENGTH`` to its final state.
+
+    Entries are derived with :meth:`FiniteMachine.step` from their one-shorter
+    prefix, so the machine remains the single source of truth.
+    """
+    machine = _get_mod_three_machine()
+    step = machine.step
+    symbols = sorted(machine.Sigma)
+    remainders = {"": machine.q0}
+    frontier = [""]
+    for _ in range(_SHORT_INPUT_MAX_LENGTH):
+        frontier = [prefix + symbol for prefix in frontier for symbol in symbols]
+        for word in frontier:
+            remainders[word] = step(remainders[word[:-1]], word[-1])
+    del remainders[""]
+    return remainders
+
+
 def modThree(input: str) -> int:
+    # Short binary strings are answered from the cached table before any other
+    # work; everything else, including invalid input, takes the checked path.
+    try:
+        remainder = _get_short_input_remainders().get(input)
+    except TypeError:
+        remainder = None  # Unhashable input; _require_str reports it below.
+    if remainder is not None:
+        return remainder
     input_value = _require_str(input)
-    machine = _get_mod_three_machine()
-    return int(machine.run(input_value))
+    return int(_get_mod_three_machine().run(input_value))
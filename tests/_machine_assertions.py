@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from typing import Any
 
 from modulo_three.machine import FiniteMachine
@@ -11,10 +12,10 @@ from modulo_three.machine import FiniteMachine
 def assert_machine_definition(
     machine: FiniteMachine[Any, Any],
     *,
-    Q: set[Any],
-    Sigma: set[Any],
+    Q: AbstractSet[Any],
+    Sigma: AbstractSet[Any],
     q0: Any,
-    F: set[Any],
+    F: AbstractSet[Any],
     delta: Mapping[tuple[Any, Any], Any],
 ) -> None:
     assert machine.Q == Q
@@ -2,31 +2,34 @@
 
 from __future__ import annotations
 
+import io
 import subprocess
 import sys
 from collections.abc import Callable, Mapping
+from collections.abc import Set as AbstractSet
 from typing import Any
 
 import pytest
+from modulo_three.__main__ import main
 from modulo_three.builder import build_binary_mod_machine
 from modulo_three.machine import FiniteMachine
 
 MachineFactory = Callable[
-    [set[Any], set[Any], Any, set[Any], Mapping[tuple[Any, Any], Any]],
+    [AbstractSet[Any], AbstractSet[Any], Any, AbstractSet[Any], Mapping[tuple[Any, Any], Any]],
     FiniteMachine[Any, Any],
 ]
 CliRunner = Callable[..., subprocess.CompletedProcess[str]]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def machine_factory() -> MachineFactory:
     """Build finite machines for tests with explicit 5-tuple inputs."""
 
     def _build(
-        Q: set[Any],
-        Sigma: set[Any],
+        Q: AbstractSet[Any],
+        Sigma: AbstractSet[Any],
         q0: Any,
-        F: set[Any],
+        F: AbstractSet[Any],
         delta: Mapping[tuple[Any, Any], Any],
     ) -> FiniteMachine[Any, Any]:
         return FiniteMachine(Q=Q, Sigma=Sigma, q0=q0, F=F, delta=delta)
@@ -34,9 +37,9 @@ def machine_factory() -> MachineFactory:
     return _build
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ab_step_machine(machine_factory: MachineFactory) -> FiniteMachine[int, str]:
-    """Two-state machine used by step/run validation tests."""
+    """Two-state machine used by step/run validation tests; shared, so read-only."""
     return machine_factory(
         {0, 1},
         {"a", "b"},
@@ -58,16 +61,19 @@ def mod_three_machine() -> FiniteMachine[int, str]:
 
 
 @pytest.fixture
-def cli_runner() -> CliRunner:
-    """Run the package CLI as a subprocess with optional stdin."""
+def cli_runner(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> CliRunner:
+    """Run the package CLI in-process with optional stdin, shaped like a subprocess result."""
 
     def _run(*args: str, input_text: str | None = None) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
-            [sys.executable, "-m", "modulo_three", *args],
-            check=False,
-            capture_output=True,
-            text=True,
-            input=input_text,
+        monkeypatch.setattr(sys, "stdin", io.StringIO(input_text or ""))
+        capsys.readouterr()
+        try:
+            returncode = main(list(args))
+        except SystemExit as exc:
+            returncode = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        captured = capsys.readouterr()
+        return subprocess.CompletedProcess(
+            ["modulo_three", *args], returncode, captured.out, captured.err
         )
 
     return _run
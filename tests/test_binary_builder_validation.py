@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import pytest
-from modulo_three.builder import build_binary_mod_machine, build_binary_mod_spec
+from modulo_three.builder import (
+    DeterministicTableMachineBuilder,
+    build_binary_mod_machine,
+    build_binary_mod_spec,
+)
 from modulo_three.machine import FiniteMachine
 
 LARGE_MOD = 10_000
@@ -59,6 +63,25 @@ def test_build_binary_mod_machine_returns_finite_machine() -> None:
     assert isinstance(machine, FiniteMachine)
 
 
+@pytest.mark.parametrize("mod", [1, 3, 7, 300])
+def test_build_binary_mod_machine_matches_validated_table_build(mod: int) -> None:
+    validated = DeterministicTableMachineBuilder[int, str]().from_spec(build_binary_mod_spec(mod))
+
+    assert build_binary_mod_machine(mod) == validated
+
+
+def test_build_binary_mod_machine_reuses_machine_per_mod() -> None:
+    assert build_binary_mod_machine(5) is build_binary_mod_machine(5)
+    assert build_binary_mod_machine(5) is not build_binary_mod_machine(6)
+
+
+def test_build_binary_mod_machine_cache_does_not_accept_bool_for_int() -> None:
+    build_binary_mod_machine(1)
+
+    with pytest.raises(TypeError):
+        build_binary_mod_machine(True)
+
+
 def test_build_binary_mod_machine_mod_2_produces_correct_transitions() -> None:
     machine = build_binary_mod_machine(2)
 
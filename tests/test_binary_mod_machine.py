@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import fields
+
+import pytest
+from modulo_three.builder import build_binary_mod_machine
 from modulo_three.machine import FiniteMachine
 
+RECURRENCE_INPUTS = ("0", "1", "1011", "111111111", "100000000001", "0110" * 40)
+
 
 def test_mod_three_builds_exact_transition_graph(
     mod_three_machine: FiniteMachine[int, str],
@@ -23,6 +30,18 @@ def test_mod_three_builds_exact_transition_graph(
     }
 
 
+def test_builder_machine_initializes_every_derived_field_like_the_constructor() -> None:
+    trusted = build_binary_mod_machine.__wrapped__(5)
+    checked = FiniteMachine(
+        Q=trusted.Q, Sigma=trusted.Sigma, q0=trusted.q0, F=trusted.F, delta=trusted.delta
+    )
+
+    for machine_field in fields(FiniteMachine):
+        assert getattr(trusted, machine_field.name) == getattr(checked, machine_field.name), (
+            machine_field.name
+        )
+
+
 def test_transition_graph_is_total_for_every_state_symbol_pair(
     mod_three_machine: FiniteMachine[int, str],
 ) -> None:
@@ -32,3 +51,90 @@ def test_transition_graph_is_total_for_every_state_symbol_pair(
             assert (state, symbol) in machine.delta
 
     assert len(machine.delta) == len(machine.Q) * len(machine.Sigma)
+
+
+@pytest.mark.parametrize("mod", [2, 5, 7, 300])
+def test_run_matches_remainder_recurrence(mod: int) -> None:
+    machine = build_binary_mod_machine(mod)
+    for binary in RECURRENCE_INPUTS:
+        expected = 0
+        for char in binary:
+            expected = (2 * expected + int(char)) % mod
+        assert machine.run(binary) == expected
+
+
+@pytest.mark.parametrize(
+    ("binary", "match"),
+    [
+        ("10x1", r"invalid symbol at index 2: 'x'"),
+        ("10" * 50 + "x1", r"invalid symbol at index 100: 'x'"),
+    ],
+)
+def test_run_reports_index_of_first_invalid_symbol(
+    mod_three_machine: FiniteMachine[int, str],
+    binary: str,
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        mod_three_machine.run(binary)
+
+
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 16, 23])
+def test_run_bytes_matches_run_across_word_boundaries(
+    mod_three_machine: FiniteMachine[int, str],
+    length: int,
+) -> None:
+    binary = ("1101001110" * 3)[:length]
+    assert mod_three_machine.run_bytes(binary.encode("ascii")) == mod_three_machine.run(binary)
+
+
+@pytest.mark.parametrize("mod", [3, 300, 2000, 20_000])
+def test_run_bytes_matches_remainder_recurrence_for_every_word_size(mod: int) -> None:
+    machine = build_binary_mod_machine(mod)
+    for length in (0, 1, 2, 3, 5, 8, 13, 64, 100):
+        binary = ("110100111010" * 9)[:length]
+        expected = 0
+        for char in binary:
+            expected = (2 * expected + int(char)) % mod
+        assert machine.run_bytes(binary.encode("ascii")) == expected
+
+
+def _strided_view(data: bytes) -> memoryview:
+    return memoryview(bytes(byte for byte in data for _ in range(2)))[::2]
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, _strided_view])
+def test_run_reads_binary_buffers_as_ascii_symbols(
+    mod_three_machine: FiniteMachine[int, str],
+    wrap: Callable[[bytes], bytes | bytearray | memoryview],
+) -> None:
+    binary = "1101001110" * 3 + "1"
+    assert mod_three_machine.run(wrap(binary.encode("ascii"))) == mod_three_machine.run(binary)
+
+
+@pytest.mark.parametrize(
+    ("binary", "match"),
+    [
+        ("1011x", r"invalid symbol at index 4: 'x'"),
+        ("101101102", r"invalid symbol at index 8: '2'"),
+        ("10110120", r"invalid symbol at index 6: '2'"),
+    ],
+)
+def test_run_bytes_reports_index_of_first_invalid_symbol(
+    mod_three_machine: FiniteMachine[int, str],
+    binary: str,
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        mod_three_machine.run_bytes(binary.encode("ascii"))
+
+
+@pytest.mark.parametrize("binary", ["1011x0", "10" * 40 + "x"])
+def test_machine_without_word_table_reports_index_of_first_invalid_symbol(binary: str) -> None:
+    machine = build_binary_mod_machine(20_000)
+    match = rf"invalid symbol at index {binary.index('x')}: 'x'"
+
+    with pytest.raises(ValueError, match=match):
+        machine.run(binary)
+    with pytest.raises(ValueError, match=match):
+        machine.run_bytes(binary.encode("ascii"))
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+import sys
 from collections.abc import Callable
+from pathlib import Path
+
+import modulo_three
 
 CliRunner = Callable[..., subprocess.CompletedProcess[str]]
 
@@ -13,9 +18,7 @@ def test_cli_happy_path_prints_remainder(
 ) -> None:
     result = cli_runner("1011")
 
-    assert result.returncode == 0
-    assert result.stdout.strip() == "2"
-    assert result.stderr == ""
+    assert (result.returncode, result.stdout.strip(), result.stderr) == (0, "2", "")
 
 
 def test_cli_invalid_binary_input_returns_error(
@@ -65,3 +68,16 @@ def test_cli_interactive_rejects_empty_input(
 
     assert result.returncode == 0
     assert "input must be non-empty" in result.stderr
+
+
+def test_cli_module_entry_point_runs_in_subprocess() -> None:
+    # -S skips site initialization; the package directory is put on the path directly.
+    result = subprocess.run(
+        [sys.executable, "-S", "-m", "modulo_three", "1011"],
+        check=False,
+        capture_output=True,
+        timeout=10,
+        env={**os.environ, "PYTHONPATH": str(Path(modulo_three.__file__).parent.parent)},
+    )
+
+    assert (result.returncode, result.stdout.strip(), result.stderr) == (0, b"2", b"")
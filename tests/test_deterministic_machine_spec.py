@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+from itertools import product
+from types import MappingProxyType
+
 import pytest
-from modulo_three.builder import DeterministicMachineSpec, DeterministicTableMachineBuilder
+from modulo_three.builder import (
+    DeterministicMachineSpec,
+    DeterministicTableMachineBuilder,
+    build_binary_mod_spec,
+    minimize_spec,
+)
 
 
 @pytest.fixture
@@ -125,3 +135,113 @@ def test_builder_rejects_spec_when_delta_is_not_total(
 
     with pytest.raises(ValueError, match=r"delta must be total over QxSigma: expected=2, actual=1"):
         table_builder.from_spec(spec)
+
+
+def test_freeze_returns_hashable_snapshot_equal_for_equal_specs() -> None:
+    transitions = {(0, "a"): 0}
+    spec = DeterministicMachineSpec(Q={0}, Sigma={"a"}, q0=0, F={0}, delta=transitions)
+    twin = DeterministicMachineSpec(Q={0}, Sigma={"a"}, q0=0, F={0}, delta={(0, "a"): 0})
+
+    frozen = spec.freeze()
+    transitions[(0, "b")] = 0
+
+    assert frozen.Q == frozenset({0})
+    assert dict(frozen.delta) == {(0, "a"): 0}
+    assert frozen == twin.freeze()
+    assert hash(frozen) == hash(twin.freeze())
+
+
+def test_builder_reuses_machine_for_equal_frozen_specs(
+    table_builder: DeterministicTableMachineBuilder[int, str],
+) -> None:
+    def make_spec() -> DeterministicMachineSpec[int, str]:
+        return DeterministicMachineSpec(
+            Q={0, 1}, Sigma={"a"}, q0=0, F={1}, delta={(0, "a"): 1, (1, "a"): 0}
+        )
+
+    machine = table_builder.from_spec(make_spec().freeze())
+
+    assert table_builder.from_spec(make_spec().freeze()) is machine
+    assert table_builder.from_spec(make_spec()) is not machine
+    assert machine.run("aaa") == 1
+
+
+def _divisibility_spec(mod: int) -> DeterministicMachineSpec[int, str]:
+    spec = build_binary_mod_spec(mod)
+    spec.F = {0}
+    return spec
+
+
+@pytest.mark.parametrize(("mod", "minimal_size"), [(1, 1), (3, 3), (4, 3), (6, 4), (12, 5)])
+def test_minimize_spec_preserves_language_with_fewest_states(
+    table_builder: DeterministicTableMachineBuilder[int, str],
+    mod: int,
+    minimal_size: int,
+) -> None:
+    spec = _divisibility_spec(mod)
+    original = table_builder.from_spec(spec)
+
+    minimized = table_builder.from_spec(minimize_spec(spec))
+
+    assert len(minimized.Q) == minimal_size
+    assert minimized.q0 == spec.q0
+    for length in range(9):
+        for bits in product("01", repeat=length):
+            assert minimized.accepts(bits) == original.accepts(bits)
+
+
+def test_minimize_spec_drops_unreachable_states_and_merges_all_accepting() -> None:
+    spec = DeterministicMachineSpec(
+        Q={"a", "b", "dead"},
+        Sigma={0, 1},
+        q0="a",
+        F={"a", "b", "dead"},
+        delta={
+            ("a", 0): "b",
+            ("a", 1): "a",
+            ("b", 0): "a",
+            ("b", 1): "b",
+            ("dead", 0): "dead",
+            ("dead", 1): "a",
+        },
+    )
+
+    minimized = minimize_spec(spec)
+
+    assert minimized.Q == {"a"}
+    assert minimized.F == {"a"}
+    assert dict(minimized.delta) == {("a", 0): "a", ("a", 1): "a"}
+
+
+def test_builder_keeps_frozen_specs_with_equal_values_of_different_types_apart(
+    table_builder: DeterministicTableMachineBuilder[int, str],
+) -> None:
+    int_spec = DeterministicMachineSpec(
+        Q={0, 1}, Sigma={"a"}, q0=0, F={1}, delta={(0, "a"): 1, (1, "a"): 0}
+    ).freeze()
+    bool_spec = DeterministicMachineSpec(
+        Q={False, True},
+        Sigma={"a"},
+        q0=False,
+        F={True},
+        delta={(False, "a"): True, (True, "a"): False},
+    ).freeze()
+
+    int_machine = table_builder.from_spec(int_spec)
+    bool_machine = table_builder.from_spec(bool_spec)
+
+    assert bool_spec != int_spec
+    assert bool_machine is not int_machine
+    assert bool_machine.q0 is False
+    assert bool_machine.run("a") is True
+
+
+def test_frozen_spec_survives_pickle_and_deepcopy_round_trips() -> None:
+    frozen = DeterministicMachineSpec(
+        Q={0, 1}, Sigma={"a"}, q0=0, F={1}, delta={(0, "a"): 1, (1, "a"): 0}
+    ).freeze()
+
+    for restored in (pickle.loads(pickle.dumps(frozen)), copy.deepcopy(frozen)):
+        assert restored == frozen
+        assert hash(restored) == hash(frozen)
+        assert isinstance(restored.delta, MappingProxyType)
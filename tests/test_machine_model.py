@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
 from collections.abc import Callable, Mapping
-from typing import Any, TypedDict, cast
+from collections.abc import Set as AbstractSet
+from types import MappingProxyType
+from typing import Any, Final, TypedDict, cast
 
 import pytest
 from modulo_three.machine import FiniteMachine
@@ -14,7 +18,7 @@ from tests._machine_assertions import (
 )
 
 type MachineFactory = Callable[
-    [set[Any], set[Any], Any, set[Any], Mapping[tuple[Any, Any], Any]],
+    [AbstractSet[Any], AbstractSet[Any], Any, AbstractSet[Any], Mapping[tuple[Any, Any], Any]],
     FiniteMachine[Any, Any],
 ]
 
@@ -27,28 +31,42 @@ class IntStrMachineArgs(TypedDict):
     delta: dict[tuple[int, str], int]
 
 
-@pytest.fixture
-def valid_machine_args() -> IntStrMachineArgs:
-    return {
-        "Q": {0, 1, 2},
-        "Sigma": {"a", "b"},
-        "q0": 0,
-        "F": {0, 2},
-        "delta": {
+class FrozenIntStrMachineArgs(TypedDict):
+    Q: frozenset[int]
+    Sigma: frozenset[str]
+    q0: int
+    F: frozenset[int]
+    delta: Mapping[tuple[int, str], int]
+
+
+_VALID_MACHINE_ARGS: Final[FrozenIntStrMachineArgs] = {
+    "Q": frozenset({0, 1, 2}),
+    "Sigma": frozenset({"a", "b"}),
+    "q0": 0,
+    "F": frozenset({0, 2}),
+    "delta": MappingProxyType(
+        {
             (0, "a"): 1,
             (0, "b"): 0,
             (1, "a"): 2,
             (1, "b"): 2,
             (2, "a"): 0,
             (2, "b"): 1,
-        },
-    }
+        }
+    ),
+}
+
 
+@pytest.fixture(scope="session")
+def valid_machine_args() -> FrozenIntStrMachineArgs:
+    """Immutable shared definition; copy with _copy_machine_args before mutating."""
+    return _VALID_MACHINE_ARGS
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_machine(
     machine_factory: MachineFactory,
-    valid_machine_args: IntStrMachineArgs,
+    valid_machine_args: FrozenIntStrMachineArgs,
 ) -> FiniteMachine[int, str]:
     return cast(
         FiniteMachine[int, str],
@@ -62,7 +80,7 @@ def valid_machine(
     )
 
 
-def _copy_machine_args(args: IntStrMachineArgs) -> IntStrMachineArgs:
+def _copy_machine_args(args: FrozenIntStrMachineArgs) -> IntStrMachineArgs:
     return {
         "Q": set(args["Q"]),
         "Sigma": set(args["Sigma"]),
@@ -74,7 +92,7 @@ def _copy_machine_args(args: IntStrMachineArgs) -> IntStrMachineArgs:
 
 def test_fields_exist_and_are_readable(
     valid_machine: FiniteMachine[int, str],
-    valid_machine_args: IntStrMachineArgs,
+    valid_machine_args: FrozenIntStrMachineArgs,
 ) -> None:
     assert_machine_definition(
         valid_machine,
@@ -88,7 +106,7 @@ def test_fields_exist_and_are_readable(
 
 def test_init_copies_input_collections(
     machine_factory: MachineFactory,
-    valid_machine_args: IntStrMachineArgs,
+    valid_machine_args: FrozenIntStrMachineArgs,
 ) -> None:
     args = _copy_machine_args(valid_machine_args)
     machine = machine_factory(
@@ -113,6 +131,33 @@ def test_init_copies_input_collections(
     )
 
 
+def test_init_freezes_state_and_symbol_sets(
+    valid_machine: FiniteMachine[int, str],
+) -> None:
+    assert isinstance(valid_machine.Q, frozenset)
+    assert isinstance(valid_machine.Sigma, frozenset)
+    assert isinstance(valid_machine.F, frozenset)
+
+
+def test_init_exposes_delta_as_read_only_mapping(
+    valid_machine: FiniteMachine[int, str],
+) -> None:
+    delta = cast(dict[tuple[int, str], int], valid_machine.delta)
+
+    with pytest.raises(TypeError):
+        delta[(0, "a")] = 1
+
+
+def test_machine_survives_pickle_and_deepcopy_round_trips(
+    valid_machine: FiniteMachine[int, str],
+) -> None:
+    for restored in (pickle.loads(pickle.dumps(valid_machine)), copy.deepcopy(valid_machine)):
+        assert restored == valid_machine
+        assert restored.run("abba") == valid_machine.run("abba")
+        with pytest.raises(TypeError):
+            cast(dict[tuple[int, str], int], restored.delta)[(0, "a")] = 1
+
+
 INVALID_DEFINITION_CASES: list[tuple[dict[str, Any], str]] = [
     (
         {"Q": {1, 2}, "q0": 0},
@@ -173,7 +218,7 @@ INVALID_DEFINITION_CASES: list[tuple[dict[str, Any], str]] = [
 )
 def test_init_raises_for_invalid_machine_definition(
     machine_factory: MachineFactory,
-    valid_machine_args: IntStrMachineArgs,
+    valid_machine_args: FrozenIntStrMachineArgs,
     overrides: dict[str, Any],
     match: str,
 ) -> None:
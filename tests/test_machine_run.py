@@ -24,6 +24,16 @@ def test_delta_must_be_total(
         machine_factory({0, 1, 2}, {"a", "b"}, 1, {0, 1, 2}, {})
 
 
+def test_delta_totality_error_lists_at_most_ten_missing_pairs(
+    machine_factory: MachineFactory,
+) -> None:
+    with pytest.raises(ValueError, match=r"expected=12, actual=0; .*\(truncated\)$") as excinfo:
+        machine_factory(set(range(6)), {"a", "b"}, 0, {0}, {})
+
+    message = str(excinfo.value)
+    assert message.count("'a')") + message.count("'b')") == 10
+
+
 def test_simple_deterministic_trace_returns_final_state(
     machine_factory: MachineFactory,
 ) -> None:
@@ -83,6 +93,76 @@ def test_run_returns_non_int_state_type(machine_factory: MachineFactory) -> None
     assert "END" == machine.run("ab")
 
 
+def test_run_bytes_handles_non_integer_states(machine_factory: MachineFactory) -> None:
+    machine = machine_factory(
+        {"EVEN", "ODD"},
+        {"a", "b"},
+        "EVEN",
+        {"EVEN"},
+        {
+            ("EVEN", "a"): "ODD",
+            ("EVEN", "b"): "EVEN",
+            ("ODD", "a"): "EVEN",
+            ("ODD", "b"): "ODD",
+        },
+    )
+
+    assert "ODD" == machine.run_bytes(b"abababbb")
+    assert "EVEN" == machine.run_bytes(b"abababbba")
+
+
+def test_run_maps_table_indices_back_to_non_integer_states(
+    machine_factory: MachineFactory,
+) -> None:
+    machine = machine_factory(
+        {"EVEN", "ODD"},
+        {"a", "b"},
+        "ODD",
+        {"EVEN"},
+        {
+            ("EVEN", "a"): "ODD",
+            ("EVEN", "b"): "EVEN",
+            ("ODD", "a"): "EVEN",
+            ("ODD", "b"): "ODD",
+        },
+    )
+    text = "ab" * 40 + "a"
+
+    assert "EVEN" == machine.run(text)
+    assert "EVEN" == machine.run(list(text))
+    assert "EVEN" == machine.run(iter(text))
+    assert "ODD" == machine.run("")
+
+
+def test_run_handles_integer_states_that_are_not_contiguous(
+    machine_factory: MachineFactory,
+) -> None:
+    machine = machine_factory(
+        {0, 1, 3},
+        {"a"},
+        0,
+        {3},
+        {(0, "a"): 1, (1, "a"): 3, (3, "a"): 0},
+    )
+
+    assert 3 == machine.run("aa")
+    assert 0 == machine.run("aaa")
+
+
+def test_run_iterates_bytes_as_integers_for_integer_symbols(
+    machine_factory: MachineFactory,
+) -> None:
+    machine = machine_factory(
+        {0, 1},
+        {0, 1},
+        0,
+        {1},
+        {(0, 0): 0, (0, 1): 1, (1, 0): 1, (1, 1): 0},
+    )
+
+    assert 1 == machine.run(bytes([1, 0, 1, 1]))
+
+
 def test_run_empty_input_returns_initial_state(
     ab_step_machine: FiniteMachine[int, str],
 ) -> None:
@@ -196,3 +276,17 @@ def test_step_raises_value_error_for_invalid_symbol_without_index(
 ) -> None:
     with pytest.raises(ValueError, match=r"invalid symbol: 'z'"):
         ab_step_machine.step(0, "z")
+
+
+def test_step_reports_index_of_invalid_symbol(
+    ab_step_machine: FiniteMachine[int, str],
+) -> None:
+    with pytest.raises(ValueError, match=r"invalid symbol at index 4: 'z'"):
+        ab_step_machine.step(1, "z", index=4)
+
+
+def test_step_raises_key_error_for_state_outside_Q(
+    ab_step_machine: FiniteMachine[int, str],
+) -> None:
+    with pytest.raises(KeyError):
+        ab_step_machine.step(7, "a")
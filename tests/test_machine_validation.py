@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from typing import Any
+
 import pytest
 from modulo_three.machine import FiniteMachine
 
+type MachineFactory = Callable[
+    [set[Any], set[Any], Any, set[Any], Mapping[tuple[Any, Any], Any]],
+    FiniteMachine[Any, Any],
+]
+
 
 def test_run_raises_type_error_for_non_iterable_input(
     ab_step_machine: FiniteMachine[int, str],
@@ -21,3 +29,50 @@ def test_run_raises_value_error_for_invalid_symbol_with_index(
         match=r"invalid symbol at index 1: 'z'",
     ):
         ab_step_machine.run("az")
+
+
+def test_run_reports_first_invalid_symbol_for_non_integer_states(
+    machine_factory: MachineFactory,
+) -> None:
+    machine = machine_factory(
+        {"EVEN", "ODD"},
+        {"a", "b"},
+        "EVEN",
+        {"EVEN"},
+        {
+            ("EVEN", "a"): "ODD",
+            ("EVEN", "b"): "EVEN",
+            ("ODD", "a"): "EVEN",
+            ("ODD", "b"): "ODD",
+        },
+    )
+
+    with pytest.raises(ValueError, match=r"invalid symbol at index 2: 'z'"):
+        machine.run("abzaz")
+
+
+def test_run_rejects_string_characters_when_symbols_are_multi_character(
+    machine_factory: MachineFactory,
+) -> None:
+    machine = machine_factory({0}, {"ab"}, 0, {0}, {(0, "ab"): 0})
+
+    assert machine.run(["ab", "ab"]) == 0
+    with pytest.raises(ValueError, match=r"invalid symbol at index 0: 'a'"):
+        machine.run("ab")
+
+
+def test_run_reports_first_invalid_symbol_in_list_input(
+    ab_step_machine: FiniteMachine[int, str],
+) -> None:
+    with pytest.raises(ValueError, match=r"invalid symbol at index 2: 'z'"):
+        ab_step_machine.run(["a", "b", "z", "a"])
+
+
+def test_run_reports_first_invalid_symbol_in_one_shot_iterable(
+    ab_step_machine: FiniteMachine[int, str],
+) -> None:
+    assert ab_step_machine.run(symbol for symbol in "aab") == 0
+    with pytest.raises(ValueError, match=r"invalid symbol at index 3: 'z'"):
+        ab_step_machine.run(symbol for symbol in "abaz")
+    with pytest.raises(ValueError, match=r"invalid symbol at index 5001: 'z'"):
+        ab_step_machine.run(symbol for symbol in "ab" * 2500 + "azb")
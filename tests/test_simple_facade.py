@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from itertools import product
 
 import modulo_three.simple_facade as simple_facade_module
 import pytest
@@ -13,6 +12,7 @@ from modulo_three.simple_facade import modThree
 
 MIN_LENGTH = 1
 MAX_LENGTH = 8
+LONG_INPUT_LENGTH = 100_003
 
 
 def _reference_mod_three(binary_string: str) -> int:
@@ -37,9 +37,10 @@ def test_mod_three_returns_expected_remainder(input_value: str, expected: int) -
     assert modThree(input_value) == expected
 
 
-def test_mod_three_rejects_non_string_input() -> None:
+@pytest.mark.parametrize("input_value", [123, b"1011", ["1", "0"]])
+def test_mod_three_rejects_non_string_input(input_value: object) -> None:
     with pytest.raises(TypeError, match=r"input must be str"):
-        modThree(123)  # type: ignore[arg-type]
+        modThree(input_value)  # type: ignore[arg-type]
 
 
 def test_mod_three_rejects_empty_input() -> None:
@@ -52,9 +53,40 @@ def test_mod_three_rejects_invalid_symbol() -> None:
         modThree("12")
 
 
+def test_mod_three_rejects_invalid_symbol_after_short_table_length() -> None:
+    with pytest.raises(ValueError, match=r"invalid symbol at index 9: '2'"):
+        modThree("1011011012")
+
+
+@pytest.mark.parametrize("invalid_symbol", ["2", "é"])
+@pytest.mark.parametrize("invalid_index", [0, 10, 63, 64, 130])
+def test_mod_three_rejects_invalid_symbol_in_long_input(
+    invalid_index: int, invalid_symbol: str
+) -> None:
+    binary = list("1101000110111" * 11)
+    binary[invalid_index] = invalid_symbol
+
+    with pytest.raises(
+        ValueError, match=rf"invalid symbol at index {invalid_index}: '{invalid_symbol}'"
+    ):
+        modThree("".join(binary))
+
+
+@pytest.mark.parametrize("input_value", ["12", "1011011012", "1011011011é", "10" * 40 + "x"])
+def test_mod_three_reports_invalid_symbols_through_the_machine(input_value: str) -> None:
+    with pytest.raises(ValueError) as machine_error:
+        build_binary_mod_machine(3).run(input_value)
+    with pytest.raises(ValueError) as facade_error:
+        modThree(input_value)
+
+    assert str(facade_error.value) == str(machine_error.value)
+
+
 def test_mod_three_reuses_cached_machine(monkeypatch: pytest.MonkeyPatch) -> None:
     cache_factory = simple_facade_module.__dict__["_get_mod_three_machine"]
+    short_input_cache = simple_facade_module.__dict__["_get_short_input_remainders"]
     cache_factory.cache_clear()
+    short_input_cache.cache_clear()
     build_count = 0
     original_build: Callable[[int], FiniteMachine[int, str]] = build_binary_mod_machine
 
@@ -70,12 +102,26 @@ def test_mod_three_reuses_cached_machine(monkeypatch: pytest.MonkeyPatch) -> Non
         assert 1 == build_count
     finally:
         cache_factory.cache_clear()
+        short_input_cache.cache_clear()
 
 
 @pytest.mark.parametrize("input_length", range(MIN_LENGTH, MAX_LENGTH + 1))
 def test_mod_three_matches_reference_for_all_binary_strings_by_length(
     input_length: int,
 ) -> None:
-    for bits in product("01", repeat=input_length):
-        binary = "".join(bits)
-        assert modThree(binary) == _reference_mod_three(binary)
+    for value in range(1 << input_length):
+        binary = format(value, f"0{input_length}b")
+        assert modThree(binary) == value % 3, binary
+
+
+@pytest.mark.parametrize("input_length", [MAX_LENGTH + 1, 31, 63, 64, 65, 200])
+def test_mod_three_matches_reference_across_length_thresholds(input_length: int) -> None:
+    binary = ("1101000110111" * 16)[:input_length]
+
+    assert modThree(binary) == _reference_mod_three(binary)
+
+
+def test_mod_three_matches_reference_for_long_input() -> None:
+    binary = ("1101000110111" * (LONG_INPUT_LENGTH // 13 + 1))[:LONG_INPUT_LENGTH]
+
+    assert modThree(binary) == _reference_mod_three(binary)
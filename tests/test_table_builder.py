@@ -22,7 +22,7 @@ class Phase(Enum):
     END = auto()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def phase_builder() -> DeterministicTableMachineBuilder[Phase, int]:
     return DeterministicTableMachineBuilder()
 
@@ -45,7 +45,7 @@ def phase_spec() -> DeterministicMachineSpec[Phase, int]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def string_builder() -> DeterministicTableMachineBuilder[str, str]:
     return DeterministicTableMachineBuilder()
 